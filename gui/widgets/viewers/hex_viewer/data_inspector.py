@@ -1,15 +1,30 @@
 """Data Inspector utilities"""
 
+import codecs
 import struct
 
 def decode_uleb128(data, pos):
     """Decode an unsigned LEB128 value from the data at the given position."""
-    result = 0
-    shift = 0
-    offset = 0
+    # Fast path for the common one and two byte encodings
+    try:
+        byte = data[pos]
+        if byte < 0x80:
+            return byte
+        result = byte & 0x7f
+
+        byte = data[pos + 1]
+        if byte < 0x80:
+            return result | (byte << 7)
+        result |= (byte & 0x7f) << 7
+    except IndexError:
+        return None
+
+    shift = 14
+    offset = 2
+    data_len = len(data)
 
     while True:
-        if pos + offset >= len(data):
+        if pos + offset >= data_len:
             return None
 
         byte = data[pos + offset]
@@ -25,12 +40,27 @@ def decode_uleb128(data, pos):
 
 def decode_sleb128(data, pos):
     """Decode a signed LEB128 value from the data at the given position."""
-    result = 0
-    shift = 0
-    offset = 0
+    # Fast path for the common one and two byte encodings
+    try:
+        byte = data[pos]
+        if byte < 0x80:
+            return byte - 0x80 if byte & 0x40 else byte
+        result = byte & 0x7f
+
+        byte = data[pos + 1]
+        if byte < 0x80:
+            result |= byte << 7
+            return result - 0x4000 if byte & 0x40 else result
+        result |= (byte & 0x7f) << 7
+    except IndexError:
+        return None
+
+    shift = 14
+    offset = 2
+    data_len = len(data)
 
     while True:
-        if pos + offset >= len(data):
+        if pos + offset >= data_len:
             return None
 
         byte = data[pos + offset]
@@ -38,67 +68,75 @@ def decode_sleb128(data, pos):
         offset += 1
 
         if not byte & 0x80:
-            if byte & 0x40:  # Sign bit is set
-                result |= -(1 << (shift + 7))
             break
 
         shift += 7
 
+    # Sign extend once from the last byte
+    if byte & 0x40:
+        result |= -(1 << (shift + 7))
+
     return result
 
+def _struct_reader(fmt):
+    """Create an inspector decoding a struct format char in the requested byte order."""
+    # Both byte orders are compiled once, unpack_from reads in place without slicing the data
+    little, big = struct.Struct('<' + fmt), struct.Struct('>' + fmt)
+    size = little.size
+
+    def read(data, pos, little_endian):
+        if pos + size > len(data):
+            return None
+        return (little if little_endian else big).unpack_from(data, pos)[0]
+
+    return read
+
+def _text_reader(encoding, size=1, big_endian_encoding=None):
+    """Create an inspector decoding size bytes as text, optionally with a separate big-endian encoding."""
+    # Decoders are looked up and created once, then reset before each use
+    little = codecs.getincrementaldecoder(encoding)(errors='replace')
+    big = codecs.getincrementaldecoder(big_endian_encoding)(errors='replace') if big_endian_encoding else little
+
+    def read(data, pos, little_endian):
+        if pos + size > len(data):
+            return None
+        decoder = little if little_endian else big
+        decoder.reset()
+        return decoder.decode(data[pos:pos+size], True)
+
+    return read
+
 DATA_INSPECTOR_TYPES = {
     "binary": lambda data, pos, little_endian: f"{data[pos]:08b}",
     "octal": lambda data, pos, little_endian: f"{data[pos]:03o}",
     "uint8": lambda data, pos, little_endian: data[pos],
-    "int8": lambda data, pos, little_endian:
-        int.from_bytes([data[pos]], byteorder='little' if little_endian else 'big', signed=True),
-    "uint16": lambda data, pos, little_endian:
-        int.from_bytes(data[pos:pos+2], byteorder='little' if little_endian else 'big', signed=False) \
-            if pos+1 < len(data) else None,
-    "int16": lambda data, pos, little_endian:
-        int.from_bytes(data[pos:pos+2], byteorder='little' if little_endian else 'big', signed=True) \
-            if pos+1 < len(data) else None,
+    "int8": _struct_reader('b'),
+    "uint16": _struct_reader('H'),
+    "int16": _struct_reader('h'),
     "uint24": lambda data, pos, little_endian:
-        int.from_bytes(data[pos:pos+3], byteorder='little' if little_endian else 'big', signed=False) \
+        int.from_bytes(memoryview(data)[pos:pos+3], byteorder='little' if little_endian else 'big', signed=False) \
             if pos+2 < len(data) else None,
     "int24": lambda data, pos, little_endian:
-        int.from_bytes(data[pos:pos+3], byteorder='little' if little_endian else 'big', signed=True) \
+        int.from_bytes(memoryview(data)[pos:pos+3], byteorder='little' if little_endian else 'big', signed=True) \
             if pos+2 < len(data) else None,
-    "uint32": lambda data, pos, little_endian:
-        int.from_bytes(data[pos:pos+4], byteorder='little' if little_endian else 'big', signed=False) \
-            if pos+3 < len(data) else None,
-    "int32": lambda data, pos, little_endian:
-        int.from_bytes(data[pos:pos+4], byteorder='little' if little_endian else 'big', signed=True) \
-            if pos+3 < len(data) else None,
-    "uint64": lambda data, pos, little_endian:
-        int.from_bytes(data[pos:pos+8], byteorder='little' if little_endian else 'big', signed=False) \
-            if pos+7 < len(data) else None,
-    "int64": lambda data, pos, little_endian:
-        int.from_bytes(data[pos:pos+8], byteorder='little' if little_endian else 'big', signed=True) \
-            if pos+7 < len(data) else None,
+    "uint32": _struct_reader('I'),
+    "int32": _struct_reader('i'),
+    "uint64": _struct_reader('Q'),
+    "int64": _struct_reader('q'),
     "ULEB128": lambda data, pos, little_endian: decode_uleb128(data, pos),
     "SLEB128": lambda data, pos, little_endian: decode_sleb128(data, pos),
-    "float16": lambda data, pos, little_endian:
-        struct.unpack('<e' if little_endian else '>e', data[pos:pos+2])[0] if pos+1 < len(data) else None,
+    "float16": _struct_reader('e'),
     "bfloat16": lambda data, pos, little_endian:
-        struct.unpack('<f', data[pos:pos+2] + b'\x00\x00')[0] if pos+1 < len(data) else None,
-    "float32": lambda data, pos, little_endian:
-        struct.unpack('<f' if little_endian else '>f', data[pos:pos+4])[0] if pos+3 < len(data) else None,
-    "float64": lambda data, pos, little_endian:
-        struct.unpack('<d' if little_endian else '>d', data[pos:pos+8])[0] if pos+7 < len(data) else None,
+        struct.unpack('<f', bytes(data[pos:pos+2]) + b'\x00\x00')[0] if pos+1 < len(data) else None,
+    "float32": _struct_reader('f'),
+    "float64": _struct_reader('d'),
     #"GUID": lambda data, pos, little_endian:
     #   str(uuid.UUID(bytes_le=bytes(data[pos:pos+16]))) if pos+15 < len(data) else None,
     "ASCII": lambda data, pos, little_endian:
         chr(data[pos]) if 32 <= data[pos] <= 126 else '.' if pos < len(data) else None,
-    "UTF-8": lambda data, pos, little_endian:
-        bytes([data[pos]]).decode('utf-8', errors='replace') if pos < len(data) else None,
-    "UTF-16": lambda data, pos, little_endian:
-        bytes(data[pos:pos+2]).decode('utf-16-le' if little_endian else 'utf-16-be', errors='replace') \
-            if pos+1 < len(data) else None,
-    "GB18030": lambda data, pos, little_endian:
-        bytes([data[pos]]).decode('gb18030', errors='replace') if pos < len(data) else None,
-    "BIG5": lambda data, pos, little_endian:
-        bytes([data[pos]]).decode('big5', errors='replace') if pos < len(data) else None,
-    "SHIFT-JIS": lambda data, pos, little_endian:
-        bytes([data[pos]]).decode('shift-jis', errors='replace') if pos < len(data) else None,
+    "UTF-8": _text_reader('utf-8'),
+    "UTF-16": _text_reader('utf-16-le', 2, 'utf-16-be'),
+    "GB18030": _text_reader('gb18030'),
+    "BIG5": _text_reader('big5'),
+    "SHIFT-JIS": _text_reader('shift-jis'),
 }
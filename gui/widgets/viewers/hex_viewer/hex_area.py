@@ -1,26 +1,52 @@
 """Provides HexArea widget."""
 
-from collections.abc import Sequence
-from dataclasses import dataclass, field
+import atexit
+from bisect import bisect_right
+from collections import OrderedDict
+from collections.abc import Callable, Sequence
 from PySide6 import QtWidgets, QtCore, QtGui
 
-@dataclass
-class HexAreaColors:
-    """Colors used in HexArea widget."""
-    header_color_begin: QtGui.QColor = field(default_factory=lambda: QtGui.QColor(240, 240, 240))
-    header_color_end: QtGui.QColor = field(default_factory=lambda: QtGui.QColor(220, 220, 220))
-    header_separator_color: QtGui.QColor = field(default_factory=lambda: QtGui.QColor(180, 180, 180))
-    header_text_color: QtGui.QColor = field(default_factory=lambda: QtGui.QColor(80, 80, 80))
-
-    address_color: QtGui.QColor = field(default_factory=lambda: QtGui.QColor(80, 80, 80))
-    hex_color: QtGui.QColor = field(default_factory=lambda: QtGui.QColor(0, 0, 0))
-    ascii_color: QtGui.QColor = field(default_factory=lambda: QtGui.QColor(0, 0, 180))
-    highlight_bg_color: QtGui.QColor = field(default_factory=lambda: QtGui.QColor(220, 240, 255))
-    highlight_fg_color: QtGui.QColor = field(default_factory=lambda: QtGui.QColor(0, 0, 0))
-    selection_bg_color: QtGui.QColor = field(default_factory=lambda: QtGui.QColor(180, 220, 255))
-    selection_fg_color: QtGui.QColor = field(default_factory=lambda: QtGui.QColor(0, 0, 0))
-    row_color: QtGui.QColor = field(default_factory=lambda: QtGui.QColor(255, 255, 255))
-    alternate_row_color: QtGui.QColor = field(default_factory=lambda: QtGui.QColor(245, 245, 245))
+from .hex_render import (ASCII_TABLE, ByteTexts, HexAreaColors, HexLayout, RowKey, render_header, render_row,
+                         setup_painter)
+
+# Number of decimal digits of n is 1 + bisect_right(_POWERS_OF_10, n)
+_POWERS_OF_10 = tuple(10 ** i for i in range(1, 20))
+
+class HexMimeData(QtCore.QMimeData):
+    """Clipboard data that converts the copied bytes to text only when it is requested."""
+
+    def __init__(self, data: memoryview, convert: Callable[[memoryview], str]):
+        super().__init__()
+        self._data = data
+        self._convert = convert
+        self._text: str | None = None
+
+    def formats(self) -> list[str]:
+        return ["text/plain"]
+
+    def hasFormat(self, mimetype: str) -> bool:
+        return mimetype == "text/plain"
+
+    def retrieveData(self, mimetype: str, preferredType: QtCore.QMetaType):
+        if mimetype != "text/plain":
+            return None
+        if self._text is None:
+            self._text = self._convert(self._data)
+        return self._text
+
+def _materialize_clipboard():
+    """Replace lazy hex data left on the clipboard with its plain text."""
+    if QtWidgets.QApplication.instance() is None:
+        return
+
+    clipboard = QtWidgets.QApplication.clipboard()
+    mime_data = clipboard.mimeData()
+    if isinstance(mime_data, HexMimeData):
+        clipboard.setText(mime_data.retrieveData("text/plain", QtCore.QMetaType()))
+
+# Qt must not call back into Python for clipboard data once the interpreter shuts down. This runs before
+# PySide's own exit handler, whether or not the event loop was ever started.
+atexit.register(_materialize_clipboard)
 
 class HexArea(QtWidgets.QWidget):
     """
@@ -30,28 +56,57 @@ class HexArea(QtWidgets.QWidget):
     cursorPositionChanged = QtCore.Signal(int)  # Offset in bytes
     selectionChanged = QtCore.Signal(int, int)  # Start and end offsets
 
-    # Data
-    _data = bytearray()
+    # Number of screens worth of rendered rows kept in the line cache
+    LINE_CACHE_SCREENS = 4
+    # Rendered rows span the visible x range widened to multiples of this many pixels
+    LINE_CACHE_X_STEP = 256
+
+    # Display settings
     _addressing_base = 16
     _bytes_per_line = 16
     _bytes_per_group = 4
     _show_ascii = True
-
-    # State
-    _cursor_pos = 0
-    _selection_start = -1
-    _selection_end = -1
-    _visible_lines = 0
-    _total_width = 0
-    _total_lines = 0
+    _antialias_text = False
 
     def __init__(self, parent: QtWidgets.QWidget | None = None):
         super().__init__(parent)
 
-        self.colors = HexAreaColors()
+        # Data, kept per instance so widgets never share a buffer
+        self._data: bytes | bytearray = b""
+        self._data_mv = memoryview(self._data)
+        self._data_view = self._data_mv.toreadonly()
+
+        # State
+        self._cursor_pos = 0
+        # The selection runs from the anchor to the cursor, lo and hi are its ordered bounds
+        self._sel_anchor = -1
+        self._sel_lo = -1
+        self._sel_hi = -1
+        self._cursor_change_pending = False
+        self._visible_lines = 0
+        self._first_visible_line = 0
+        self._first_visible_x = 0
+        self._total_width = 0
+        self._total_lines = 0
+
+        self._colors = HexAreaColors()
+
+        # Row key -> rendered row
+        self._line_cache: OrderedDict[RowKey, QtGui.QImage] = OrderedDict()
+        # Header rendered for the rounded up width, None when it needs rendering again
+        self._header_image: QtGui.QImage | None = None
+        self._header_width = 0
+        # Inputs the scrollbars and the address width were last computed for
+        self._scrollbar_key: tuple | None = None
+        self._addr_width_key: tuple[int, int, int] | None = None
+        self._addr_width = 0
+        # Layout shared by the header and row renderers, None until _get_layout() rebuilds it
+        self._layout: HexLayout | None = None
 
         self.setFocusPolicy(QtGui.Qt.FocusPolicy.StrongFocus)
         self.setMouseTracking(True)
+        # paintEvent fills its whole region, which lets scroll() move the rows on screen as pixels
+        self.setAttribute(QtCore.Qt.WidgetAttribute.WA_OpaquePaintEvent)
 
         self._main_layout = QtWidgets.QGridLayout(self)
         self._main_layout.setContentsMargins(0, 0, 0, 0)
@@ -65,9 +120,9 @@ class HexArea(QtWidgets.QWidget):
         self._v_scrollbar = QtWidgets.QScrollBar(QtCore.Qt.Orientation.Vertical, self)
         self._h_scrollbar = QtWidgets.QScrollBar(QtCore.Qt.Orientation.Horizontal, self)
         self._v_scrollbar.setVisible(False)
-        self._v_scrollbar.valueChanged.connect(self.update)
+        self._v_scrollbar.valueChanged.connect(self._scroll_rows)
         self._h_scrollbar.setVisible(False)
-        self._h_scrollbar.valueChanged.connect(self.update)
+        self._h_scrollbar.valueChanged.connect(self._scroll_columns)
         self._main_layout.addWidget(self._v_scrollbar, 0, 1)
         self._main_layout.addWidget(self._h_scrollbar, 1, 0)
 
@@ -80,19 +135,40 @@ class HexArea(QtWidgets.QWidget):
         self._update_scrollbar()
 
     @property
-    def data(self) -> bytearray:
+    def colors(self) -> HexAreaColors:
+        """Get the colors used for drawing."""
+        return self._colors
+
+    @colors.setter
+    def colors(self, value: HexAreaColors):
+        """Set the colors used for drawing."""
+        self._colors = value
+        self._line_cache.clear()
+        self._layout = None
+        self.update()
+
+    @property
+    def data(self) -> bytes | bytearray:
         """Get the data being displayed."""
         return self._data
 
     @data.setter
-    def data(self, value: bytearray):
+    def data(self, value: bytes | bytearray):
         """Set the data to be displayed."""
         self._data = value
+        # Rows are read through a view, which also keeps the data from being resized while displayed
+        self._data_mv = memoryview(value)
+        self._data_view = self._data_mv.toreadonly()
+        self._line_cache.clear()
+        self._layout = None
         self._cursor_pos = 0
-        self._selection_start = -1
-        self._selection_end = -1
-        self._update_scrollbar()
-        self.update()
+        self._clear_selection()
+        self._invalidate_layout()
+
+    @property
+    def data_view(self) -> memoryview:
+        """Get a read-only view of the data being displayed, for slicing without copies."""
+        return self._data_view
 
     @property
     def addressing_base(self) -> int:
@@ -105,7 +181,9 @@ class HexArea(QtWidgets.QWidget):
         if value not in (16, 10, 8):
             raise ValueError("Addressing base must be 16 (hex), 10 (decimal), or 8 (octal).")
         self._addressing_base = value
-        self.update()
+        self._line_cache.clear()
+        self._layout = None
+        self._invalidate_layout()
 
     @property
     def bytes_per_line(self) -> int:
@@ -118,8 +196,9 @@ class HexArea(QtWidgets.QWidget):
         if value not in (8, 16, 32, 64):
             raise ValueError("Bytes per line must be 8, 16, 32, or 64.")
         self._bytes_per_line = value
-        self._update_scrollbar()
-        self.update()
+        self._line_cache.clear()
+        self._layout = None
+        self._invalidate_layout()
 
     @property
     def bytes_per_group(self) -> int:
@@ -130,6 +209,9 @@ class HexArea(QtWidgets.QWidget):
     def bytes_per_group(self, value: int):
         """Set the number of bytes per group."""
         self._bytes_per_group = value
+        self._line_cache.clear()
+        self._layout = None
+        self._invalidate_layout()
 
     @property
     def show_ascii(self) -> bool:
@@ -140,7 +222,21 @@ class HexArea(QtWidgets.QWidget):
     def show_ascii(self, value: bool):
         """Set whether to show ASCII representation."""
         self._show_ascii = value
-        self._update_scrollbar()
+        self._line_cache.clear()
+        self._layout = None
+        self._invalidate_layout()
+
+    @property
+    def antialias_text(self) -> bool:
+        """Get whether text is drawn antialiased."""
+        return self._antialias_text
+
+    @antialias_text.setter
+    def antialias_text(self, value: bool):
+        """Set whether text is drawn antialiased."""
+        self._antialias_text = value
+        self._line_cache.clear()
+        self._layout = None
         self.update()
 
     @property
@@ -157,24 +253,25 @@ class HexArea(QtWidgets.QWidget):
 
     def _update_scrollbar(self):
         """Update the vertical and horizontal scrollbars based on data size and viewport."""
+        # Nothing to reconfigure unless the viewport, data size or layout changed
+        key = (self._hex_widget.width(), self._hex_widget.height() // self._char_height, len(self._data),
+               self._addressing_base, self._bytes_per_line, self._bytes_per_group, self._show_ascii,
+               self._char_width, self._char_height)
+        if key == self._scrollbar_key:
+            return
+        self._scrollbar_key = key
+
         if len(self._data) == 0:
             self._v_scrollbar.setVisible(False)
             self._h_scrollbar.setVisible(False)
             self._corner_widget.setVisible(False)
             return
 
-        # Calculate the width needed for full display
-        address_width = self._calculate_address_width()
-        hex_width = (self._char_width * 4) * self._bytes_per_line  # Width for hex columns
-        if self._bytes_per_group > 1:
-            hex_width += (self._bytes_per_line // self._bytes_per_group - 1) * self._char_width
-
-        ascii_width = 0
-        if self._show_ascii:
-            ascii_width = int(self._char_width * 1.5) * self._bytes_per_line
+        layout = self._get_layout()
 
         # Total content width with padding
-        self._total_width = total_width = address_width + hex_width + ascii_width + self._char_width * 2 + 40
+        self._total_width = total_width = (layout.addr_width + layout.hex_area.width + layout.ascii_area.width
+                                           + self._char_width * 2 + 40)
 
         # Calculate available width accounting for the vertical scrollbar
         available_width = self._hex_widget.width()
@@ -219,218 +316,160 @@ class HexArea(QtWidgets.QWidget):
             self._corner_widget.setFixedSize(self._v_scrollbar.width(), self._h_scrollbar.height())
             self._corner_widget.setVisible(True)
 
+    def _invalidate_layout(self):
+        """Reconfigure the scrollbars for a changed layout and repaint once."""
+        # Clamping the scrollbars must not scroll or repaint on its own, the whole widget is repainted below
+        with QtCore.QSignalBlocker(self._v_scrollbar), QtCore.QSignalBlocker(self._h_scrollbar):
+            self._update_scrollbar()
+
+        self._first_visible_line = self._v_scrollbar.value()
+        self._first_visible_x = self._h_scrollbar.value()
+        self.update()
+
     def _measure_font_metrics(self):
-        """Measure font metrics for the current font."""
-        self._font_metrics = QtGui.QFontMetrics(self.font())
-        # Find the widest character among 0-9, A-F, and 'Address' letters
-        chars = "0123456789ABCDEFdres"
-        self._char_width = max(self._font_metrics.horizontalAdvance(c) for c in chars)
-        self._char_height = self._font_metrics.height()
+        """Measure font metrics and lay out the byte texts for the current font."""
+        self._texts = ByteTexts(self.font())
+        self._char_width = self._texts.char_width
+        self._char_height = self._texts.char_height
+        self._layout = None
+
+    def _get_layout(self) -> HexLayout:
+        """Get the layout of the header and rows, rebuilding it after a change."""
+        if self._layout is None:
+            self._layout = HexLayout(self._texts, self._colors, self._antialias_text, self._addressing_base,
+                                     self._calculate_address_width(), self._bytes_per_line, self._bytes_per_group,
+                                     self._show_ascii)
+            self._header_image = None
+        return self._layout
 
     def _calculate_address_width(self) -> int:
         """Calculate the width needed for address display."""
+        key = (len(self._data), self._addressing_base, self._char_width)
+        if key != self._addr_width_key:
+            self._addr_width_key = key
+            self._addr_width = self._measure_address_width()
+        return self._addr_width
+
+    def _measure_address_width(self) -> int:
+        """Measure the width needed for address display."""
         if len(self._data) == 0:
             return 8 * self._char_width  # Minimum width
 
-        # Calculate required width based on addressing mode and data size
+        # Calculate required width based on addressing mode and data size,
+        # digit counts come from the bit length rather than formatting the address
         max_address = len(self._data) - 1
         min_width = len("Address") - 2
 
         if self._addressing_base == 16:  # Hex
-            addr_chars = max(min_width, len(f"{max_address:X}"))
+            addr_chars = max(min_width, (max(1, max_address).bit_length() + 3) >> 2)
             return (addr_chars + 2) * self._char_width  # +2 for "0x"
         if self._addressing_base == 8:  # Octal
-            addr_chars = max(min_width, len(f"{max_address:o}"))
+            addr_chars = max(min_width, (max(1, max_address).bit_length() + 2) // 3)
             return (addr_chars + 2) * self._char_width  # +2 for "0o"
         # Decimal
-        addr_chars = max(min_width + 2, len(str(max_address)))
+        addr_chars = max(min_width + 2, 1 + bisect_right(_POWERS_OF_10, max_address))
         return addr_chars * self._char_width
 
-    def _draw_header(self, painter: QtGui.QPainter, rect: QtCore.QRect, addr_width: int,
-                    hex_width: int, ascii_width: int):
+    def _draw_header(self, painter: QtGui.QPainter, rect: QtCore.QRect):
         """Draw the header with column addresses."""
-        header_rect = QtCore.QRect(rect.left(),
-                                   rect.top(),
-                                   rect.width(),
-                                   self._char_height + 8
-                                   )
-
-        # Draw header background
-        header_bg = QtGui.QLinearGradient(header_rect.topLeft(), header_rect.bottomLeft())
-        header_bg.setColorAt(0, self.colors.header_color_begin)
-        header_bg.setColorAt(1, self.colors.header_color_end)
-        painter.fillRect(header_rect, header_bg)
-
-        # Draw header separator line
-        painter.setPen(self.colors.header_separator_color)
-        painter.drawLine(header_rect.left(), header_rect.bottom(),
-                        header_rect.right(), header_rect.bottom())
-
-        # Draw address column header
-        painter.setPen(self.colors.header_text_color)
-        addr_rect = QtCore.QRect(rect.left(), rect.top(), addr_width, self._char_height + 8)  # Increased height
-        painter.drawText(addr_rect, QtCore.Qt.AlignmentFlag.AlignCenter, "Address")
-
-        # Draw column separators
-        painter.setPen(self.colors.header_separator_color)
-        painter.drawLine(addr_rect.right(), header_rect.top(),
-                        addr_rect.right(), header_rect.bottom())
-
-        # Draw hex column headers (00-0F)
-        hex_start_x = addr_rect.right() + 10
-
-        painter.setPen(self.colors.header_text_color)
-        col_width = self._char_width * 4  # Increased width for hex columns
-        x_offset = 0
-
-        for i in range(self._bytes_per_line):
-            # Add extra space for group separator
-            if i > 0 and i % self._bytes_per_group == 0:
-                x_offset += self._char_width
-
-            column_text = f"{i:02X}"
-            col_rect = QtCore.QRect(hex_start_x + i * col_width + x_offset, rect.top(),
-                            col_width, self._char_height + 8)
-
-            painter.drawText(col_rect, QtCore.Qt.AlignmentFlag.AlignCenter, column_text)
-
-        # Draw hex/ASCII separator
-        if self._show_ascii:
-            painter.setPen(self.colors.header_separator_color)
-            ascii_start_x = hex_start_x + hex_width + x_offset + 5
-            painter.drawLine(ascii_start_x - 5, header_rect.top(),
-                            ascii_start_x - 5, header_rect.bottom())
-
-            # Draw ASCII header
-            ascii_header_rect = QtCore.QRect(ascii_start_x, rect.top(),
-                                    ascii_width, self._char_height + 8)
-            painter.setPen(self.colors.header_text_color)
-            painter.drawText(ascii_header_rect, QtCore.Qt.AlignmentFlag.AlignCenter, "ASCII")
-
-    def _draw_hex_content(self, painter: QtGui.QPainter, rect: QtCore.QRect, addr_width: int,
-                         hex_width: int, ascii_width: int):
-        """Draw the hex content and ASCII representation."""
+        # The header only changes with the layout, it is rendered once and reused by every paint
+        step = self.LINE_CACHE_X_STEP
+        width = -(-rect.width() // step) * step
+        dpr = self.devicePixelRatioF()
+        layout = self._get_layout()
+        if self._header_image is None or self._header_width != width or self._header_image.devicePixelRatio() != dpr:
+            self._header_image = render_header(layout, width, dpr)
+            self._header_width = width
+        painter.drawImage(rect.left(), rect.top(), self._header_image)
+
+    def _draw_hex_content(self, painter: QtGui.QPainter, rect: QtCore.QRect, region: QtGui.QRegion):
+        """Draw the hex content and ASCII representation of the rows inside the region."""
         if len(self._data) == 0:
             return
 
-        # Calculate positions
-        addr_x = rect.left()
-        hex_x = addr_x + addr_width + 10
-
         row_height = self._char_height
-        bytes_per_row = self._bytes_per_line
-
-        # Calculate visible range
         first_row = self._v_scrollbar.value()
-        visible_rows = min(self._visible_lines,
-                          (len(self._data) + bytes_per_row - 1) // bytes_per_row - first_row)
 
-        # For each visible row
-        for row in range(visible_rows):
+        # Rows are only rendered across the horizontally visible part of the content, widened to whole
+        # steps so that resizing and short horizontal scrolls keep reusing the cached rows
+        h_offset = self._h_scrollbar.value()
+        step = self.LINE_CACHE_X_STEP
+        left = h_offset // step * step
+        right = -(-(h_offset + self._hex_widget.width()) // step) * step
+
+        # Rows rendered for another screen's pixel ratio are not reused after the widget moves
+        dpr = self.devicePixelRatioF()
+
+        # For each visible row in the dirty rect, rows in gaps of the region are skipped
+        for row in self._dirty_rows(rect, region):
             y = rect.top() + row * row_height
-            row_addr = (first_row + row) * bytes_per_row
+            if region.intersects(QtCore.QRect(0, y, self.width(), row_height)):
+                key = self._row_key(first_row + row, left, right, dpr)
+                painter.drawImage(rect.left() + left, y, self._row_image(key))
 
-            # Draw alternating row backgrounds
-            if (first_row + row) % 2 == 0:
-                painter.fillRect(QtCore.QRect(rect.left(), y, rect.width(), row_height),
-                                self.colors.row_color)
-            else:
-                painter.fillRect(QtCore.QRect(rect.left(), y, rect.width(), row_height),
-                                self.colors.alternate_row_color)
-
-            # Draw address
-            painter.setPen(self.colors.address_color)
-            addr_rect = QtCore.QRect(addr_x, y, addr_width, row_height)
-
-            # Use minimum width of "Address" (7 chars)
-            min_width = max(5, len("Address") - 2)  # -2 for the "0x" or "0o" prefix
-
-            if self._addressing_base == 16:  # Hex
-                addr_text = f"0x{row_addr:0{min_width}X}"
-            elif self._addressing_base == 8:  # Octal
-                addr_text = f"0o{row_addr:0{min_width}o}"
-            else:  # Decimal
-                addr_text = f"{row_addr:0{min_width+2}d}"  # +2 to account for missing prefix
-
-            painter.drawText(addr_rect, QtCore.Qt.AlignmentFlag.AlignCenter, addr_text)
-
-            # Draw bytes for this row
-            max_bytes = min(bytes_per_row, len(self._data) - row_addr)
-            col_width = self._char_width * 4
-            x_offset = 0
-
-            for col in range(max_bytes):
-                byte_addr = row_addr + col
-                byte_val = self._data[byte_addr]
-
-                # Calculate position for this byte
-                byte_x = hex_x + col * col_width
-
-                # Add extra space for group separator
-                if col > 0 and col % self._bytes_per_group == 0:
-                    x_offset += self._char_width
-
-                byte_rect = QtCore.QRect(
-                    int(byte_x + self._char_width / 2 + x_offset),
-                    y,
-                    col_width - self._char_width,
-                    row_height
-                    )
+    def _dirty_rows(self, rect: QtCore.QRect, region: QtGui.QRegion) -> range:
+        """Get the on-screen indices of the visible rows within the bounding rect of the region."""
+        visible_rows = min(self._visible_lines,
+                          (len(self._data) + self._bytes_per_line - 1) // self._bytes_per_line
+                          - self._v_scrollbar.value())
+        dirty_rect = region.boundingRect()
+        first_dirty = max(0, (dirty_rect.top() - rect.top()) // self._char_height)
+        last_dirty = min(visible_rows, (dirty_rect.bottom() - rect.top()) // self._char_height + 1)
+        return range(first_dirty, last_dirty)
+
+    def _row_key(self, row: int, left: int, right: int, dpr: float) -> RowKey:
+        """Get the key of a row rendered across the given content x range."""
+        # Rows are cached by the part of the selection and the cursor they contain
+        row_addr = row * self._bytes_per_line
+        row_end = row_addr + self._bytes_per_line - 1
+        row_sel = None
+        if 0 <= self._sel_lo <= row_end and self._sel_hi >= row_addr:
+            row_sel = (max(self._sel_lo, row_addr) - row_addr, min(self._sel_hi, row_end) - row_addr)
+        cursor_col = self._cursor_pos - row_addr if row_addr <= self._cursor_pos <= row_end else -1
+        return RowKey(row, left, right, row_sel, cursor_col, dpr)
+
+    def _row_image(self, key: RowKey) -> QtGui.QImage:
+        """Get the image of a row from the line cache, rendering it on a miss."""
+        try:
+            image = self._line_cache[key]
+            self._line_cache.move_to_end(key)
+        except KeyError:
+            image = render_row(self._get_layout(), self._data_mv, key)
+            self._line_cache[key] = image
+            if len(self._line_cache) > self.LINE_CACHE_SCREENS * self._visible_lines:
+                self._line_cache.popitem(last=False)
+        return image
+
+    def _scroll_rows(self, line: int):
+        """Scroll the rows on screen to a new first visible line."""
+        delta = line - self._first_visible_line
+        self._first_visible_line = line
+        if abs(delta) >= self._visible_lines:
+            self.update()
+            return
 
-                # Check if this byte is selected or cursor is here
-                is_selected = (self._selection_start >= 0 and
-                              byte_addr >= min(self._selection_start, self._selection_end) and
-                              byte_addr <= max(self._selection_start, self._selection_end))
-                is_cursor = byte_addr == self._cursor_pos
-
-                # Draw background if selected or cursor is here
-                if is_selected:
-                    painter.fillRect(byte_rect, self.colors.selection_bg_color)
-                    painter.setPen(self.colors.selection_fg_color)
-                elif is_cursor:
-                    painter.fillRect(byte_rect, self.colors.highlight_bg_color)
-                    painter.setPen(self.colors.highlight_fg_color)
-                else:
-                    painter.setPen(self.colors.hex_color)
-
-                byte_text = f"{byte_val:02X}"
-                painter.drawText(byte_rect, QtCore.Qt.AlignmentFlag.AlignCenter, byte_text)
-
-            ascii_x = hex_x + hex_width + (self._bytes_per_line // self._bytes_per_group - 1) * self._char_width + 15
-
-            # Draw ASCII representation
-            if self._show_ascii:
-                for col in range(max_bytes):
-                    byte_addr = row_addr + col
-                    byte_val = self._data[byte_addr]
-
-                    # Calculate position for this ASCII char
-                    char_x = ascii_x + col * int(self._char_width * 1.5)
-                    char_rect = QtCore.QRect(char_x, y, int(self._char_width * 1.5), row_height)
-
-                    # Check if this byte is selected or cursor is here
-                    is_selected = (self._selection_start >= 0 and
-                                  byte_addr >= min(self._selection_start, self._selection_end) and
-                                  byte_addr <= max(self._selection_start, self._selection_end))
-                    is_cursor = byte_addr == self._cursor_pos
-
-                    # Draw background if selected or cursor is here
-                    if is_selected:
-                        painter.fillRect(char_rect, self.colors.selection_bg_color)
-                        painter.setPen(self.colors.selection_fg_color)
-                    elif is_cursor:
-                        painter.fillRect(char_rect, self.colors.highlight_bg_color)
-                        painter.setPen(self.colors.highlight_fg_color)
-                    else:
-                        painter.setPen(self.colors.ascii_color)
-
-                    # Get printable character or dot for control chars
-                    if 32 <= byte_val <= 126:  # Printable ASCII
-                        char = chr(byte_val)
-                    else:
-                        char = '.'
-
-                    painter.drawText(char_rect, QtCore.Qt.AlignmentFlag.AlignCenter, char)
+        # Rows that stay on screen are moved as pixels, only the exposed rows are repainted
+        rect = self._content_rect()
+        rect.setTop(rect.top() + self._char_height + 8)
+        self.scroll(0, -delta * self._char_height, rect)
+
+    def _scroll_columns(self, x: int):
+        """Scroll the header and rows on screen to a new horizontal offset."""
+        delta = x - self._first_visible_x
+        self._first_visible_x = x
+        rect = self._content_rect()
+        if abs(delta) >= rect.width():
+            self.update()
+            return
+
+        self.scroll(-delta, 0, rect)
+
+    def _content_rect(self) -> QtCore.QRect:
+        """Get the area the header and rows are drawn in, which reaches under a hidden horizontal scrollbar."""
+        rect = self._hex_widget.geometry()
+        if self._h_scrollbar.isHidden():
+            rect.setBottom(self.height() - 1)
+        return rect
 
     def _ensure_cursor_visible(self):
         """Ensure the cursor is visible by scrolling if necessary."""
@@ -439,6 +478,10 @@ class HexArea(QtWidgets.QWidget):
 
         cursor_line = self._cursor_pos // self._bytes_per_line
 
+        # Most moves stay within the visible lines and need no scrollbar access
+        if self._first_visible_line <= cursor_line < self._first_visible_line + self._visible_lines:
+            return
+
         if cursor_line < self._v_scrollbar.value():
             # Cursor is above visible area, scroll up
             self._v_scrollbar.setValue(cursor_line)
@@ -447,14 +490,55 @@ class HexArea(QtWidgets.QWidget):
             # TODO: Fix the bottom issue
             self._v_scrollbar.setValue(cursor_line - self._visible_lines + 1)
 
+    def _row_rect(self, row: int) -> QtCore.QRect:
+        """Get the widget rectangle of a data row."""
+        top = self._hex_widget.geometry().top() + self._char_height + 8
+        return QtCore.QRect(0, top + (row - self._v_scrollbar.value()) * self._char_height,
+                            self.width(), self._char_height)
+
+    def _cursor_span(self) -> tuple[int, int]:
+        """Get the byte range covered by the cursor and the selection."""
+        if self._sel_anchor < 0:
+            return self._cursor_pos, self._cursor_pos
+        return min(self._cursor_pos, self._sel_lo), max(self._cursor_pos, self._sel_hi)
+
+    def _update_span(self, span: tuple[int, int]):
+        """Repaint the visible rows containing the given byte range."""
+        first_row = max(span[0] // self._bytes_per_line, self._v_scrollbar.value())
+        last_row = min(span[1] // self._bytes_per_line, self._v_scrollbar.value() + self._visible_lines)
+        if first_row <= last_row:
+            self.update(self._row_rect(first_row).united(self._row_rect(last_row)))
+
+    def _update_cursor_rows(self, old_span: tuple[int, int]):
+        """Repaint the rows whose cursor or selection changed."""
+        self._update_span(old_span)
+        self._update_span(self._cursor_span())
+
+    def _select_to_cursor(self, anchor: int):
+        """Select from the anchor to the cursor."""
+        self._sel_anchor = anchor
+        if anchor <= self._cursor_pos:
+            self._sel_lo, self._sel_hi = anchor, self._cursor_pos
+        else:
+            self._sel_lo, self._sel_hi = self._cursor_pos, anchor
+
+    def _extend_selection(self, default_anchor: int):
+        """Extend the selection to the cursor, anchoring it at default_anchor if nothing is selected."""
+        self._select_to_cursor(self._sel_anchor if self._sel_anchor >= 0 else default_anchor)
+
+    def _clear_selection(self):
+        """Clear the selection."""
+        self._sel_anchor = self._sel_lo = self._sel_hi = -1
+
     def setFont(self, font: QtGui.QFont | str | Sequence[str]):
         super().setFont(font)
         self._measure_font_metrics()
+        self._line_cache.clear()
+        self._invalidate_layout()
 
     def resizeEvent(self, event: QtGui.QResizeEvent):
         """Handle resize events to update the scrollbar and layout."""
-        self._update_scrollbar()
-        self.update()
+        self._invalidate_layout()
 
     def mousePressEvent(self, event: QtGui.QMouseEvent):
         """Handle mouse press events."""
@@ -464,24 +548,18 @@ class HexArea(QtWidgets.QWidget):
         # Calculate which byte was clicked, if any
         byte_addr = self._byte_at_position(event.position().toPoint())
         if byte_addr >= 0 and byte_addr < len(self._data):
+            old_span = self._cursor_span()
             self._cursor_pos = byte_addr
 
-            if event.modifiers() & QtCore.Qt.KeyboardModifier.ShiftModifier:
+            if event.modifiers() & QtCore.Qt.KeyboardModifier.ShiftModifier and self._sel_anchor >= 0:
                 # Extend selection
-                if self._selection_start < 0:
-                    self._selection_start = byte_addr
-                self._selection_end = byte_addr
+                self._select_to_cursor(self._sel_anchor)
             else:
                 # Start new selection
-                self._selection_start = byte_addr
-                self._selection_end = byte_addr
+                self._select_to_cursor(byte_addr)
 
-            self.update()
-            self.cursorPositionChanged.emit(byte_addr)
-            self.selectionChanged.emit(
-                min(self._selection_start, self._selection_end),
-                max(self._selection_start, self._selection_end)
-            )
+            self._update_cursor_rows(old_span)
+            self._post_cursor_change()
 
     def mouseMoveEvent(self, event: QtGui.QMouseEvent):
         """Handle mouse move events."""
@@ -491,14 +569,13 @@ class HexArea(QtWidgets.QWidget):
         # Extend selection if button is pressed
         byte_addr = self._byte_at_position(event.position().toPoint())
         if byte_addr >= 0 and byte_addr < len(self._data):
+            old_span = self._cursor_span()
             self._cursor_pos = byte_addr
-            self._selection_end = byte_addr
+            if self._sel_anchor >= 0:
+                self._select_to_cursor(self._sel_anchor)
 
-            self.update()
-            self.selectionChanged.emit(
-                min(self._selection_start, self._selection_end),
-                max(self._selection_start, self._selection_end)
-            )
+            self._update_cursor_rows(old_span)
+            self._post_cursor_change()
 
     def _byte_at_position(self, pos: QtCore.QPoint) -> int:
         """Get the byte address at the given position."""
@@ -518,24 +595,19 @@ class HexArea(QtWidgets.QWidget):
         if pos.y() < rect.top():
             return -1
 
-        # Calculate layout
-        address_width = self._calculate_address_width()
-        hex_width = (self._char_width * 4) * self._bytes_per_line  # Increased width for hex columns
-        if self._bytes_per_group > 1:
-            hex_width += (self._bytes_per_line // self._bytes_per_group - 1) * self._char_width
+        layout = self._get_layout()
 
         # Check if click is in hex area or ASCII area
-        hex_start_x = rect.left() + address_width + 10  # Increased spacing
-        hex_end_x = hex_start_x + hex_width
+        hex_start_x = rect.left() + layout.hex_area.x
+        hex_end_x = hex_start_x + layout.hex_area.width
 
         in_hex_area = pos.x() >= hex_start_x and pos.x() < hex_end_x
 
         in_ascii_area = False
         ascii_start_x = 0
         if self._show_ascii:
-            ascii_start_x = hex_end_x + (self._bytes_per_line // self._bytes_per_group - 1) * self._char_width + 15
-            ascii_end_x = ascii_start_x + int(self._char_width * 1.5) * self._bytes_per_line
-            in_ascii_area = pos.x() >= ascii_start_x and pos.x() < ascii_end_x
+            ascii_start_x = rect.left() + layout.ascii_area.x
+            in_ascii_area = ascii_start_x <= pos.x() < ascii_start_x + layout.ascii_area.width
 
         if not (in_hex_area or in_ascii_area):
             return -1
@@ -547,25 +619,17 @@ class HexArea(QtWidgets.QWidget):
         col = -1
 
         if in_hex_area:
-            # Calculate column in hex area
-            rel_x = pos.x() - hex_start_x
-            col_width = self._char_width * 4  # Increased width for hex columns
+            # Calculate column in hex area, columns are followed by one extra char after every group
+            group, group_x = divmod(pos.x() - hex_start_x, layout.group_pixel_width)
+            col_in_group = group_x // (self._char_width * 4)
 
-            for i in range(self._bytes_per_line):
-                col_x = i * col_width
-
-                # Add extra space for group separator
-                if i > 0 and i % self._bytes_per_group == 0:
-                    col_x += self._char_width
-
-                if rel_x >= col_x and rel_x < col_x + col_width:
-                    col = i
-                    break
+            # Clicks on the gap after a group do not hit any byte
+            if col_in_group < self._bytes_per_group:
+                col = group * self._bytes_per_group + col_in_group
 
         elif in_ascii_area:
             # Calculate column in ASCII area
-            rel_x = pos.x() - ascii_start_x
-            col = rel_x // int(self._char_width * 1.5)
+            col = (pos.x() - ascii_start_x) // layout.ascii_area.cell_width
 
         if col >= 0 and col < self._bytes_per_line:
             byte_addr = row * self._bytes_per_line + col
@@ -574,6 +638,33 @@ class HexArea(QtWidgets.QWidget):
 
         return -1
 
+    def _move_cursor(self, new_pos: int, shift: bool, default_anchor: int):
+        """Move the cursor for a key press, extending the selection to it if shift is held."""
+        old_span = self._cursor_span()
+        self._cursor_pos = new_pos
+        if shift:
+            self._extend_selection(default_anchor)
+        else:
+            self._select_to_cursor(new_pos)
+
+        self._ensure_cursor_visible()
+        self._update_cursor_rows(old_span)
+        self._post_cursor_change()
+
+    def _post_cursor_change(self):
+        """Emit the cursor and selection signals once the current event loop turn is over."""
+        # Every cursor and selection change comes through here, so key repeats and mouse drags within one turn
+        # collapse into a single pair of signals
+        if not self._cursor_change_pending:
+            self._cursor_change_pending = True
+            QtCore.QTimer.singleShot(0, self._flush_cursor_change)
+
+    def _flush_cursor_change(self):
+        """Emit the cursor and selection signals for the current state."""
+        self._cursor_change_pending = False
+        self.cursorPositionChanged.emit(self._cursor_pos)
+        self.selectionChanged.emit(self._sel_lo, self._sel_hi)
+
     def wheelEvent(self, event: QtGui.QWheelEvent):
         """Handle mouse wheel events."""
         if len(self._data) == 0:
@@ -614,201 +705,62 @@ class HexArea(QtWidgets.QWidget):
                 max_first_line = self._total_lines - self._visible_lines
                 self._v_scrollbar.setValue(min(max_first_line, self._v_scrollbar.value() + lines_to_scroll))
 
-        self.update()
-
     def keyPressEvent(self, event: QtGui.QKeyEvent):
         """Handle key press events."""
         if len(self._data) == 0:
             return
 
-        if event.key() == QtGui.Qt.Key.Key_Left:
+        key = event.key()
+        shift = bool(event.modifiers() & QtGui.Qt.KeyboardModifier.ShiftModifier)
+        pos = self._cursor_pos
+        bytes_per_line = self._bytes_per_line
+
+        # Without a selection, shift+move anchors at the old position, or the other end of the line for Home/End
+        if key == QtGui.Qt.Key.Key_Left:
             # Move cursor left
-            if self._cursor_pos > 0:
-                self._cursor_pos -= 1
-
-                # Update selection if shift is pressed
-                if event.modifiers() & QtGui.Qt.KeyboardModifier.ShiftModifier:
-                    if self._selection_start < 0:
-                        self._selection_start = self._cursor_pos + 1
-                    self._selection_end = self._cursor_pos
-                else:
-                    self._selection_start = self._selection_end = self._cursor_pos
-
-                # Ensure cursor is visible
-                self._ensure_cursor_visible()
-                self.update()
-                self.cursorPositionChanged.emit(self._cursor_pos)
-                self.selectionChanged.emit(
-                    min(self._selection_start, self._selection_end),
-                    max(self._selection_start, self._selection_end)
-                )
+            if pos > 0:
+                self._move_cursor(pos - 1, shift, pos)
 
-        elif event.key() == QtGui.Qt.Key.Key_Right:
+        elif key == QtGui.Qt.Key.Key_Right:
             # Move cursor right
-            if self._cursor_pos < len(self._data) - 1:
-                self._cursor_pos += 1
-
-                # Update selection if shift is pressed
-                if event.modifiers() & QtGui.Qt.KeyboardModifier.ShiftModifier:
-                    if self._selection_start < 0:
-                        self._selection_start = self._cursor_pos - 1
-                    self._selection_end = self._cursor_pos
-                else:
-                    self._selection_start = self._selection_end = self._cursor_pos
-
-                # Ensure cursor is visible
-                self._ensure_cursor_visible()
-                self.update()
-                self.cursorPositionChanged.emit(self._cursor_pos)
-                self.selectionChanged.emit(
-                    min(self._selection_start, self._selection_end),
-                    max(self._selection_start, self._selection_end)
-                )
+            if pos < len(self._data) - 1:
+                self._move_cursor(pos + 1, shift, pos)
 
-        elif event.key() == QtGui.Qt.Key.Key_Up:
+        elif key == QtGui.Qt.Key.Key_Up:
             # Move cursor up
-            if self._cursor_pos >= self._bytes_per_line:
-                self._cursor_pos -= self._bytes_per_line
-
-                # Update selection if shift is pressed
-                if event.modifiers() & QtGui.Qt.KeyboardModifier.ShiftModifier:
-                    if self._selection_start < 0:
-                        self._selection_start = self._cursor_pos + self._bytes_per_line
-                    self._selection_end = self._cursor_pos
-                else:
-                    self._selection_start = self._selection_end = self._cursor_pos
-
-                # Ensure cursor is visible
-                self._ensure_cursor_visible()
-                self.update()
-                self.cursorPositionChanged.emit(self._cursor_pos)
-                self.selectionChanged.emit(
-                    min(self._selection_start, self._selection_end),
-                    max(self._selection_start, self._selection_end)
-                )
+            if pos >= bytes_per_line:
+                self._move_cursor(pos - bytes_per_line, shift, pos)
 
-        elif event.key() == QtGui.Qt.Key.Key_Down:
+        elif key == QtGui.Qt.Key.Key_Down:
             # Move cursor down
-            if self._cursor_pos + self._bytes_per_line < len(self._data):
-                self._cursor_pos += self._bytes_per_line
-
-                # Update selection if shift is pressed
-                if event.modifiers() & QtGui.Qt.KeyboardModifier.ShiftModifier:
-                    if self._selection_start < 0:
-                        self._selection_start = self._cursor_pos - self._bytes_per_line
-                    self._selection_end = self._cursor_pos
-                else:
-                    self._selection_start = self._selection_end = self._cursor_pos
-
-                # Ensure cursor is visible
-                self._ensure_cursor_visible()
-                self.update()
-                self.cursorPositionChanged.emit(self._cursor_pos)
-                self.selectionChanged.emit(
-                    min(self._selection_start, self._selection_end),
-                    max(self._selection_start, self._selection_end)
-                )
+            if pos + bytes_per_line < len(self._data):
+                self._move_cursor(pos + bytes_per_line, shift, pos)
 
-        elif event.key() == QtGui.Qt.Key.Key_Home:
+        elif key == QtGui.Qt.Key.Key_Home:
             # Move cursor to start of line
-            line_start = (self._cursor_pos // self._bytes_per_line) * self._bytes_per_line
-            self._cursor_pos = line_start
-
-            # Update selection if shift is pressed
-            if event.modifiers() & QtGui.Qt.KeyboardModifier.ShiftModifier:
-                if self._selection_start < 0:
-                    self._selection_start = line_start + self._bytes_per_line - 1
-                self._selection_end = self._cursor_pos
-            else:
-                self._selection_start = self._selection_end = self._cursor_pos
+            line_start = (pos // bytes_per_line) * bytes_per_line
+            self._move_cursor(line_start, shift, line_start + bytes_per_line - 1)
 
-            # Ensure cursor is visible
-            self._ensure_cursor_visible()
-            self.update()
-            self.cursorPositionChanged.emit(self._cursor_pos)
-            self.selectionChanged.emit(
-                min(self._selection_start, self._selection_end),
-                max(self._selection_start, self._selection_end)
-            )
-
-        elif event.key() == QtGui.Qt.Key.Key_End:
+        elif key == QtGui.Qt.Key.Key_End:
             # Move cursor to end of line
-            line_start = (self._cursor_pos // self._bytes_per_line) * self._bytes_per_line
-            line_end = min(line_start + self._bytes_per_line - 1, len(self._data) - 1)
-            self._cursor_pos = line_end
-
-            # Update selection if shift is pressed
-            if event.modifiers() & QtGui.Qt.KeyboardModifier.ShiftModifier:
-                if self._selection_start < 0:
-                    self._selection_start = line_start
-                self._selection_end = self._cursor_pos
-            else:
-                self._selection_start = self._selection_end = self._cursor_pos
+            line_start = (pos // bytes_per_line) * bytes_per_line
+            self._move_cursor(min(line_start + bytes_per_line - 1, len(self._data) - 1), shift, line_start)
 
-            # Ensure cursor is visible
-            self._ensure_cursor_visible()
-            self.update()
-            self.cursorPositionChanged.emit(self._cursor_pos)
-            self.selectionChanged.emit(
-                min(self._selection_start, self._selection_end),
-                max(self._selection_start, self._selection_end)
-            )
-
-        elif event.key() == QtGui.Qt.Key.Key_PageUp:
+        elif key == QtGui.Qt.Key.Key_PageUp:
             # Move cursor up one page
-            old_pos = self._cursor_pos
-            lines_to_move = min(self._visible_lines, self._cursor_pos // self._bytes_per_line)
-            self._cursor_pos -= lines_to_move * self._bytes_per_line
-
-            # Update selection if shift is pressed
-            if event.modifiers() & QtGui.Qt.KeyboardModifier.ShiftModifier:
-                if self._selection_start < 0:
-                    self._selection_start = old_pos
-                self._selection_end = self._cursor_pos
-            else:
-                self._selection_start = self._selection_end = self._cursor_pos
-
-            # Ensure cursor is visible
-            self._ensure_cursor_visible()
-            self.update()
-            self.cursorPositionChanged.emit(self._cursor_pos)
-            self.selectionChanged.emit(
-                min(self._selection_start, self._selection_end),
-                max(self._selection_start, self._selection_end)
-            )
-
-        elif event.key() == QtGui.Qt.Key.Key_PageDown:
-            # Move cursor down one page
-            old_pos = self._cursor_pos
-            bytes_per_page = self._visible_lines * self._bytes_per_line
-
-            if self._cursor_pos + bytes_per_page < len(self._data):
-                self._cursor_pos += bytes_per_page
-            else:
-                self._cursor_pos = len(self._data) - 1
-
-            # Update selection if shift is pressed
-            if event.modifiers() & QtGui.Qt.KeyboardModifier.ShiftModifier:
-                if self._selection_start < 0:
-                    self._selection_start = old_pos
-                self._selection_end = self._cursor_pos
-            else:
-                self._selection_start = self._selection_end = self._cursor_pos
+            lines_to_move = min(self._visible_lines, pos // bytes_per_line)
+            self._move_cursor(pos - lines_to_move * bytes_per_line, shift, pos)
 
-            # Ensure cursor is visible
-            self._ensure_cursor_visible()
-            self.update()
-            self.cursorPositionChanged.emit(self._cursor_pos)
-            self.selectionChanged.emit(
-                min(self._selection_start, self._selection_end),
-                max(self._selection_start, self._selection_end)
-            )
+        elif key == QtGui.Qt.Key.Key_PageDown:
+            # Move cursor down one page, or to the last byte
+            self._move_cursor(min(pos + self._visible_lines * bytes_per_line, len(self._data) - 1), shift, pos)
 
-        elif event.key() == QtGui.Qt.Key.Key_Escape:
+        elif key == QtGui.Qt.Key.Key_Escape:
             # Clear selection
-            self._selection_start = self._selection_end = -1
-            self.update()
-            self.selectionChanged.emit(-1, -1)
+            old_span = self._cursor_span()
+            self._clear_selection()
+            self._update_span(old_span)
+            self._post_cursor_change()
 
         else:
             super().keyPressEvent(event)
@@ -818,10 +770,15 @@ class HexArea(QtWidgets.QWidget):
         h_offset = self._h_scrollbar.value()
 
         painter = QtGui.QPainter(self)
-        painter.setFont(self.font())
+        setup_painter(painter, self.font(), self._antialias_text)
+
+        # Qt does not erase an opaque widget, so the area around the header and rows is cleared here
+        painter.fillRect(event.rect(), self.palette().color(QtGui.QPalette.ColorRole.Window))
 
         # Calculate basic layout measurements - avoid drawing in scrollbar area
         rect = self._hex_widget.geometry()
+        # Only this area is moved by scroll(), content drawn outside of it would be left behind
+        painter.setClipRect(self._content_rect(), QtCore.Qt.ClipOperation.IntersectClip)
 
         # Adjust for horizontal scrolling
         painter.translate(-h_offset, 0)
@@ -831,28 +788,19 @@ class HexArea(QtWidgets.QWidget):
             painter.drawText(rect, QtCore.Qt.AlignmentFlag.AlignCenter, "No data")
             return
 
-        # Calculate layout
-        address_width = self._calculate_address_width()
-        hex_width = (self._char_width * 4) * self._bytes_per_line  # Increased width for hex columns
-        if self._bytes_per_group > 1:
-            # Extra space between groups
-            hex_width += (self._bytes_per_line // self._bytes_per_group - 1) * self._char_width
-
-        ascii_width = 0
-        if self._show_ascii:
-            ascii_width = int(self._char_width * 1.5) * self._bytes_per_line  # Increased spacing for ASCII chars
-
         rect.setWidth(max(self._total_width, rect.width()))
 
-        # Draw the header
-        self._draw_header(painter, rect, address_width, hex_width, ascii_width)
+        # Draw the header, unless only rows below it need repainting
+        region = event.region()
+        header_height = self._char_height + 8  # Increased header height
+        if region.intersects(QtCore.QRect(0, rect.top(), self.width(), header_height)):
+            self._draw_header(painter, rect)
 
         # Adjusted rect for content
-        header_height = self._char_height + 8  # Increased header height
         rect.setTop(rect.top() + header_height)
 
         # Draw content rows
-        self._draw_hex_content(painter, rect, address_width, hex_width, ascii_width)
+        self._draw_hex_content(painter, rect, region)
 
     def contextMenuEvent(self, event: QtGui.QContextMenuEvent):
         """Handle context menu events."""
@@ -884,54 +832,48 @@ class HexArea(QtWidgets.QWidget):
         # Execute the menu
         menu.exec(event.globalPos())
 
+    def _selected_range(self) -> tuple[int, int] | None:
+        """Get the selected byte range as inclusive (start, end) clamped to the data, or None."""
+        if self._sel_anchor < 0 or len(self._data) == 0:
+            return None
+
+        last = len(self._data) - 1
+        return min(self._sel_lo, last), min(self._sel_hi, last)
+
     def _copy_selection_as_hex(self):
         """Copy the selected bytes as hex values."""
-        if self._selection_start < 0 or len(self._data) == 0:
+        selected = self._selected_range()
+        if selected is None:
             return
 
-        start = min(self._selection_start, self._selection_end)
-        end = max(self._selection_start, self._selection_end)
-
-        if start >= len(self._data):
-            start = len(self._data) - 1
-        if end >= len(self._data):
-            end = len(self._data) - 1
-
-        selected_bytes = self._data[start:end+1]
-        hex_text = ' '.join(f"{b:02X}" for b in selected_bytes)
-
-        QtWidgets.QApplication.clipboard().setText(hex_text)
+        # The view keeps the selected bytes alive, they are hexed straight from it on paste
+        start, end = selected
+        QtWidgets.QApplication.clipboard().setMimeData(
+            HexMimeData(self._data_view[start:end+1], lambda view: view.hex(' ').upper())
+        )
 
     def _copy_selection_as_ascii(self):
         """Copy the selected bytes as ASCII text."""
-        if self._selection_start < 0 or len(self._data) == 0:
+        selected = self._selected_range()
+        if selected is None:
             return
 
-        start = min(self._selection_start, self._selection_end)
-        end = max(self._selection_start, self._selection_end)
-
-        if start >= len(self._data):
-            start = len(self._data) - 1
-        if end >= len(self._data):
-            end = len(self._data) - 1
-
-        selected_bytes = self._data[start:end+1]
-        ascii_text = ''.join(chr(b) if 32 <= b <= 126 else '.' for b in selected_bytes)
-
-        QtWidgets.QApplication.clipboard().setText(ascii_text)
+        start, end = selected
+        QtWidgets.QApplication.clipboard().setMimeData(
+            HexMimeData(self._data_view[start:end+1],
+                        lambda view: view.tobytes().translate(ASCII_TABLE).decode('ascii'))
+        )
 
     def _select_all(self):
         """Select all bytes."""
         if len(self._data) == 0:
             return
 
-        self._selection_start = 0
-        self._selection_end = len(self._data) - 1
-        self._cursor_pos = self._selection_end
+        self._cursor_pos = len(self._data) - 1
+        self._select_to_cursor(0)
 
         self.update()
-        self.cursorPositionChanged.emit(self._cursor_pos)
-        self.selectionChanged.emit(self._selection_start, self._selection_end)
+        self._post_cursor_change()
 
     def _go_to_address(self):
         """Go to a specific address."""
@@ -939,10 +881,11 @@ class HexArea(QtWidgets.QWidget):
             self, "Go to Address", "Enter address (decimal or 0x prefix for hex):"
         )
 
+        address = address.strip()
         if ok and address:
             try:
-                # Try to parse as hex if it has 0x prefix
-                if address.lower().startswith("0x"):
+                # Try to parse as hex if it has 0x prefix, int(address, 0) would reject leading zeros in decimal
+                if address.startswith(("0x", "0X")):
                     addr = int(address[2:], 16)
                 else:
                     addr = int(address)
@@ -950,12 +893,11 @@ class HexArea(QtWidgets.QWidget):
                 # Ensure address is in range
                 if 0 <= addr < len(self._data):
                     self._cursor_pos = addr
-                    self._selection_start = self._selection_end = addr
+                    self._select_to_cursor(addr)
 
                     self._ensure_cursor_visible()
                     self.update()
-                    self.cursorPositionChanged.emit(self._cursor_pos)
-                    self.selectionChanged.emit(addr, addr)
+                    self._post_cursor_change()
                 else:
                     QtWidgets.QMessageBox.warning(
                         self, "Invalid Address",
@@ -0,0 +1,323 @@
+"""Provides the header and row rendering used by HexArea."""
+
+from bisect import bisect_left, bisect_right
+from collections.abc import Iterator
+from dataclasses import dataclass, field
+from typing import NamedTuple
+from PySide6 import QtCore, QtGui
+
+# Two-digit uppercase hex text of every byte value
+HEX_LUT = tuple(f"{i:02X}" for i in range(256))
+# Maps every byte to itself if it is printable ASCII, otherwise to '.'
+ASCII_TABLE = bytes(b if 32 <= b <= 126 else 0x2E for b in range(256))
+# Row address formatters by addressing base, padded to the width of "Address" (7 chars)
+ADDRESS_FORMATS = {
+    16: "0x{:05X}".format,
+    8: "0o{:05o}".format,
+    10: "{:07d}".format,
+}
+
+@dataclass
+class HexAreaColors:
+    """Colors used in HexArea widget."""
+    header_color_begin: QtGui.QColor = field(default_factory=lambda: QtGui.QColor(240, 240, 240))
+    header_color_end: QtGui.QColor = field(default_factory=lambda: QtGui.QColor(220, 220, 220))
+    header_separator_color: QtGui.QColor = field(default_factory=lambda: QtGui.QColor(180, 180, 180))
+    header_text_color: QtGui.QColor = field(default_factory=lambda: QtGui.QColor(80, 80, 80))
+
+    address_color: QtGui.QColor = field(default_factory=lambda: QtGui.QColor(80, 80, 80))
+    hex_color: QtGui.QColor = field(default_factory=lambda: QtGui.QColor(0, 0, 0))
+    ascii_color: QtGui.QColor = field(default_factory=lambda: QtGui.QColor(0, 0, 180))
+    highlight_bg_color: QtGui.QColor = field(default_factory=lambda: QtGui.QColor(220, 240, 255))
+    highlight_fg_color: QtGui.QColor = field(default_factory=lambda: QtGui.QColor(0, 0, 0))
+    selection_bg_color: QtGui.QColor = field(default_factory=lambda: QtGui.QColor(180, 220, 255))
+    selection_fg_color: QtGui.QColor = field(default_factory=lambda: QtGui.QColor(0, 0, 0))
+    row_color: QtGui.QColor = field(default_factory=lambda: QtGui.QColor(255, 255, 255))
+    alternate_row_color: QtGui.QColor = field(default_factory=lambda: QtGui.QColor(245, 245, 245))
+
+def prepare_static_text(text: str, font: QtGui.QFont) -> QtGui.QStaticText:
+    """Create a static text laid out for the given font."""
+    static_text = QtGui.QStaticText(text)
+    # Byte texts are never markup, and keeping their glyph runs cached is cheap for a few hundred strings
+    static_text.setTextFormat(QtCore.Qt.TextFormat.PlainText)
+    static_text.setPerformanceHint(QtGui.QStaticText.PerformanceHint.AggressiveCaching)
+    static_text.prepare(QtGui.QTransform(), font)
+    return static_text
+
+@dataclass
+class ByteTexts:
+    """Font metrics and the byte and header texts laid out once for a font."""
+    font: QtGui.QFont
+    metrics: QtGui.QFontMetrics
+    char_width: int
+    char_height: int
+    ascent: int
+    # Byte texts and the x offsets centering them in their cell, indexed by byte value
+    hex: list[QtGui.QStaticText]
+    hex_x: list[int]
+    ascii: list[QtGui.QStaticText]
+    ascii_x: list[int]
+    address_header: QtGui.QStaticText
+    ascii_header: QtGui.QStaticText
+
+    def __init__(self, font: QtGui.QFont):
+        self.font = font
+        self.metrics = QtGui.QFontMetrics(font)
+        # Find the widest character among 0-9, A-F, and 'Address' letters
+        self.char_width = max(self.metrics.horizontalAdvance(c) for c in "0123456789ABCDEFdres")
+        self.char_height = self.metrics.height()
+        self.ascent = self.metrics.ascent()
+
+        # Byte texts are drawn at the x offset that centers them in their cell
+        hex_cell_width = self.char_width * 3
+        ascii_cell_width = int(self.char_width * 1.5)
+        self.hex = [prepare_static_text(text, font) for text in HEX_LUT]
+        self.hex_x = [(hex_cell_width - round(text.size().width())) // 2 for text in self.hex]
+        # Indexed by the raw byte value, all non-printable bytes share the static text of '.'
+        ascii_static = {b: prepare_static_text(chr(b), font) for b in set(ASCII_TABLE)}
+        self.ascii = [ascii_static[b] for b in ASCII_TABLE]
+        self.ascii_x = [(ascii_cell_width - round(text.size().width())) // 2 for text in self.ascii]
+        self.address_header = prepare_static_text("Address", font)
+        self.ascii_header = prepare_static_text("ASCII", font)
+
+@dataclass
+class CellArea:
+    """Byte cells of the hex or ASCII area of a row."""
+    x: int
+    width: int
+    col_x: tuple[int, ...]
+    cell_width: int
+    row_height: int
+    texts: list[QtGui.QStaticText]
+    texts_x: list[int]
+    # Text pen and background of each pen run kind, indexed as (text, selection, cursor)
+    pens: tuple[QtGui.QColor, QtGui.QColor, QtGui.QColor]
+    backgrounds: tuple[QtGui.QColor | None, QtGui.QColor, QtGui.QColor]
+
+@dataclass
+class HexLayout:
+    """Column layout and drawing settings shared by the header and every rendered row."""
+    texts: ByteTexts
+    colors: HexAreaColors
+    antialias_text: bool
+    addressing_base: int
+    addr_width: int
+    bytes_per_line: int
+    bytes_per_group: int
+    show_ascii: bool
+
+    hex_area: CellArea = field(init=False)
+    ascii_area: CellArea = field(init=False)
+    # Used by hit testing, where a group of columns is followed by one extra char
+    group_pixel_width: int = field(init=False)
+
+    def __post_init__(self):
+        char_width = self.texts.char_width
+        bytes_per_line = self.bytes_per_line
+        bytes_per_group = self.bytes_per_group
+        colors = self.colors
+
+        col_width = char_width * 4
+        hex_width = col_width * bytes_per_line
+        if bytes_per_group > 1:
+            hex_width += (bytes_per_line // bytes_per_group - 1) * char_width
+
+        hex_x = self.addr_width + 10
+        ascii_x = hex_x + hex_width + (bytes_per_line // bytes_per_group - 1) * char_width + 15
+
+        # Hex cells are centered in their column and shifted by one char after every group
+        hex_col_x = tuple(
+            int(hex_x + col * col_width + char_width / 2 + (col // bytes_per_group) * char_width)
+            for col in range(bytes_per_line)
+        )
+        ascii_cell_width = int(char_width * 1.5)
+        ascii_col_x = tuple(ascii_x + col * ascii_cell_width for col in range(bytes_per_line))
+
+        fg_colors = (colors.selection_fg_color, colors.highlight_fg_color)
+        backgrounds = (None, colors.selection_bg_color, colors.highlight_bg_color)
+        row_height = self.texts.char_height
+        self.hex_area = CellArea(hex_x, hex_width, hex_col_x, col_width - char_width, row_height, self.texts.hex,
+                                 self.texts.hex_x, (colors.hex_color, *fg_colors), backgrounds)
+        self.ascii_area = CellArea(ascii_x, ascii_cell_width * bytes_per_line if self.show_ascii else 0, ascii_col_x,
+                                   ascii_cell_width, row_height, self.texts.ascii, self.texts.ascii_x,
+                                   (colors.ascii_color, *fg_colors), backgrounds)
+        self.group_pixel_width = col_width * bytes_per_group + char_width
+
+class RowKey(NamedTuple):
+    """A rendered row, identified by everything its image depends on besides the layout."""
+    row: int
+    # Content x range the row is rendered across
+    left: int
+    right: int
+    # First and last selected column of the row, or None
+    selection: tuple[int, int] | None
+    # Cursor column, or -1 if the cursor is not in the row
+    cursor_col: int
+    device_pixel_ratio: float
+
+def setup_painter(painter: QtGui.QPainter, font: QtGui.QFont, antialias_text: bool):
+    """Set the font and render hints used for all hex area drawing."""
+    # The grid is made of axis-aligned rects, only text may need antialiasing
+    painter.setFont(font)
+    painter.setRenderHint(QtGui.QPainter.RenderHint.Antialiasing, False)
+    painter.setRenderHint(QtGui.QPainter.RenderHint.TextAntialiasing, antialias_text)
+    painter.setRenderHint(QtGui.QPainter.RenderHint.SmoothPixmapTransform, False)
+
+def _create_image(width: int, height: int, device_pixel_ratio: float) -> QtGui.QImage:
+    """Create an image of the given logical size at the given device pixel ratio."""
+    # Images are composed on the CPU, which avoids syncing a pixmap with the graphics backend
+    image = QtGui.QImage(QtCore.QSize(width, height) * device_pixel_ratio,
+                         QtGui.QImage.Format.Format_ARGB32_Premultiplied)
+    image.setDevicePixelRatio(device_pixel_ratio)
+    return image
+
+def render_header(layout: HexLayout, width: int, device_pixel_ratio: float) -> QtGui.QImage:
+    """Render the header background, separators and column labels into an image."""
+    image = _create_image(width, layout.texts.char_height + 8, device_pixel_ratio)
+
+    painter = QtGui.QPainter(image)
+    setup_painter(painter, layout.texts.font, layout.antialias_text)
+    _paint_header(painter, layout, width)
+    painter.end()
+    return image
+
+def _paint_header(painter: QtGui.QPainter, layout: HexLayout, width: int):
+    """Paint the header at the painter's origin."""
+    texts = layout.texts
+    colors = layout.colors
+    header_rect = QtCore.QRect(0, 0, width, texts.char_height + 8)
+
+    # Draw header background
+    header_bg = QtGui.QLinearGradient(0, header_rect.top(), 0, header_rect.bottom())
+    header_bg.setColorAt(0, colors.header_color_begin)
+    header_bg.setColorAt(1, colors.header_color_end)
+    painter.fillRect(header_rect, header_bg)
+
+    # Draw header separator line
+    painter.setPen(colors.header_separator_color)
+    painter.drawLine(header_rect.left(), header_rect.bottom(),
+                    header_rect.right(), header_rect.bottom())
+
+    # Draw address column header
+    painter.setPen(colors.header_text_color)
+    addr_right = layout.addr_width - 1
+    text_top = 4
+    _draw_static_centered(painter, 0, layout.addr_width, text_top, texts.address_header)
+
+    # Draw column separators
+    painter.setPen(colors.header_separator_color)
+    painter.drawLine(addr_right, header_rect.top(), addr_right, header_rect.bottom())
+
+    # Draw hex column headers (00-0F)
+    hex_start_x = addr_right + 10
+
+    painter.setPen(colors.header_text_color)
+    col_width = texts.char_width * 4  # Increased width for hex columns
+    x_offset = 0
+
+    for i in range(layout.bytes_per_line):
+        # Add extra space for group separator
+        if i > 0 and i % layout.bytes_per_group == 0:
+            x_offset += texts.char_width
+
+        # Column labels reuse the prepared byte texts
+        _draw_static_centered(painter, hex_start_x + i * col_width + x_offset, col_width, text_top, texts.hex[i])
+
+    # Draw hex/ASCII separator
+    if layout.show_ascii:
+        painter.setPen(colors.header_separator_color)
+        ascii_start_x = hex_start_x + layout.hex_area.width + x_offset + 5
+        painter.drawLine(ascii_start_x - 5, header_rect.top(),
+                        ascii_start_x - 5, header_rect.bottom())
+
+        # Draw ASCII header
+        painter.setPen(colors.header_text_color)
+        _draw_static_centered(painter, ascii_start_x, layout.ascii_area.width, text_top, texts.ascii_header)
+
+def _draw_static_centered(painter: QtGui.QPainter, x: int, width: int, y: int, static_text: QtGui.QStaticText):
+    """Draw a static text horizontally centered in the given span."""
+    painter.drawStaticText(x + (width - round(static_text.size().width())) // 2, y, static_text)
+
+def render_row(layout: HexLayout, data: memoryview, key: RowKey) -> QtGui.QImage:
+    """Render the part of a row between the left and right content x of its key into an image."""
+    image = _create_image(key.right - key.left, layout.texts.char_height, key.device_pixel_ratio)
+    image.fill(0)
+
+    painter = QtGui.QPainter(image)
+    setup_painter(painter, layout.texts.font, layout.antialias_text)
+    painter.translate(-key.left, 0)
+    _draw_row(painter, layout, data, key)
+    painter.end()
+    return image
+
+def _draw_row(painter: QtGui.QPainter, layout: HexLayout, data: memoryview, key: RowKey):
+    """Draw the address, hex bytes and ASCII text of a row at the painter's origin."""
+    texts = layout.texts
+    colors = layout.colors
+    row_addr = key.row * layout.bytes_per_line
+    row_bytes = data[row_addr:row_addr + layout.bytes_per_line]
+
+    # Draw alternating row backgrounds
+    painter.fillRect(QtCore.QRect(key.left, 0, key.right - key.left, texts.char_height),
+                     colors.row_color if key.row % 2 == 0 else colors.alternate_row_color)
+
+    # Draw address centered at its baseline, which skips the aligned text layout of drawText
+    addr_text = ADDRESS_FORMATS[layout.addressing_base](row_addr)
+    painter.setPen(colors.address_color)
+    painter.drawText((layout.addr_width - texts.metrics.horizontalAdvance(addr_text)) // 2, texts.ascent, addr_text)
+
+    # The hex and ASCII areas are drawn from the same runs of columns sharing a pen
+    runs = _pen_runs(key, len(row_bytes))
+    _draw_cells(painter, layout.hex_area, row_bytes, runs, key)
+    if layout.show_ascii:
+        _draw_cells(painter, layout.ascii_area, row_bytes, runs, key)
+
+def _pen_runs(key: RowKey, row_length: int) -> list[tuple[int, int, int]]:
+    """Split a row into runs of (first, last, pen) columns, with pens indexed as (text, selection, cursor)."""
+    sel_first, sel_last = key.selection if key.selection is not None else (0, -1)
+    marks = []
+    if sel_first <= sel_last:
+        marks.append((sel_first, sel_last, 1))
+    if key.cursor_col >= 0 and not sel_first <= key.cursor_col <= sel_last:
+        marks.append((key.cursor_col, key.cursor_col, 2))
+
+    runs = []
+    run_start = 0
+    for first, last, pen in sorted(marks):
+        if run_start < first:
+            runs.append((run_start, first - 1, 0))
+        runs.append((first, last, pen))
+        run_start = last + 1
+    if run_start < row_length:
+        runs.append((run_start, row_length - 1, 0))
+    return runs
+
+def _draw_cells(painter: QtGui.QPainter, area: CellArea, row_bytes: memoryview, runs: list[tuple[int, int, int]],
+                key: RowKey):
+    """Draw the cells of one area of a row."""
+    col_x = area.col_x
+
+    # Fill the selection with one rect and the cursor cell separately
+    for first, last, pen in runs:
+        if pen:
+            painter.fillRect(QtCore.QRect(col_x[first], 0, col_x[last] + area.cell_width - col_x[first],
+                                          area.row_height),
+                             area.backgrounds[pen])
+
+    static_texts = area.texts
+    static_x = area.texts_x
+    draw_static_text = painter.drawStaticText
+    for first, end, pen in _visible_runs(area, runs, key):
+        painter.setPen(area.pens[pen])
+        for col, value in enumerate(row_bytes[first:end], first):
+            draw_static_text(col_x[col] + static_x[value], 0, static_texts[value])
+
+def _visible_runs(area: CellArea, runs: list[tuple[int, int, int]], key: RowKey) -> Iterator[tuple[int, int, int]]:
+    """Clip the runs to the columns between the left and right x of the key, yielding (first, end, pen)."""
+    first_visible = bisect_right(area.col_x, key.left - area.cell_width)
+    end_visible = bisect_left(area.col_x, key.right)
+    for first, last, pen in runs:
+        first = max(first, first_visible)
+        end = min(last + 1, end_visible)
+        if first < end:
+            yield first, end, pen
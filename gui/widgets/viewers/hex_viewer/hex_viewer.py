@@ -15,12 +15,19 @@ class HexViewer(Viewer):
     name = "Hex Viewer"
     allow_unsupported_extensions = True
 
-    _data_inspector_labels: dict[str, QtWidgets.QLabel] = {}
-
     def __init__(self, parent=None):
         super().__init__(parent)
 
         self._file: IFile | None = None
+        self._data_inspector_labels: dict[str, QtWidgets.QLabel] = {}
+        # Set when the data inspector skipped an update while hidden
+        self._data_inspector_dirty = False
+
+        # Cursor moves are batched, only the position where the cursor settles gets decoded
+        self._data_inspector_timer = QtCore.QTimer(self)
+        self._data_inspector_timer.setSingleShot(True)
+        self._data_inspector_timer.setInterval(40)
+        self._data_inspector_timer.timeout.connect(self._update_data_inspector_now)
 
         self.area = HexArea(self)
 
@@ -43,9 +50,7 @@ class HexViewer(Viewer):
         self._data_inspector_action = QtGui.QAction("Data Inspector", self)
         self._data_inspector_action.setCheckable(True)
         self._data_inspector_action.setChecked(True)
-        self._data_inspector_action.toggled.connect(
-            lambda: self._data_inspector.setVisible(self._data_inspector_action.isChecked())
-        )
+        self._data_inspector_action.toggled.connect(self._toggle_data_inspector)
         self._toolbar.addAction(self._data_inspector_action)
 
         self._toolbar.addSeparator()
@@ -165,11 +170,31 @@ class HexViewer(Viewer):
             setattr(color, attr, QtGui.QColor(clr))
         self.area.colors = color
 
+    def _toggle_data_inspector(self, checked: bool):
+        """Show or hide the data inspector, refreshing it if it went stale while hidden."""
+        self._data_inspector.setVisible(checked)
+        if checked and self._data_inspector_dirty:
+            self._update_data_inspector_now()
+
+    def showEvent(self, event: QtGui.QShowEvent):
+        """Handle show events to refresh a data inspector that went stale while hidden."""
+        super().showEvent(event)
+        if self._data_inspector_dirty:
+            self._update_data_inspector_now()
+
     def _update_data_inspector(self):
+        """Schedule an update of the data inspector labels."""
+        self._data_inspector_timer.start()
+
+    def _update_data_inspector_now(self):
         """Update the data inspector labels based on the current cursor position."""
+        self._data_inspector_timer.stop()
 
+        # Hidden labels are not decoded, they are refreshed once the inspector is shown again
         if not self._data_inspector.isVisible():
+            self._data_inspector_dirty = True
             return
+        self._data_inspector_dirty = False
 
         if len(self.area.data) == 0:
             for label in self._data_inspector_labels.values():
@@ -177,15 +202,18 @@ class HexViewer(Viewer):
             return
 
         little_endian = self._data_inspector_little_endian.isChecked()
+        # Decoders slice the view, which does not copy the bytes
+        data = self.area.data_view
+        pos = self.area.cursor_byte_pos
 
         for name, label in self._data_inspector_labels.items():
-            value = DATA_INSPECTOR_TYPES[name](self.area.data, self.area.cursor_byte_pos, little_endian)
+            value = DATA_INSPECTOR_TYPES[name](data, pos, little_endian)
             if value is not None:
                 label.setText(str(value))
             else:
                 label.setText("")
 
-    def set_data(self, data: bytearray):
+    def set_data(self, data: bytes | bytearray):
         """Set the data to be displayed in the hex viewer."""
         self._total_bytes_label.setText(f"{len(data)} bytes in total")
         self.area.data = data
@@ -193,11 +221,12 @@ class HexViewer(Viewer):
 
     def set_file(self, file: IFile):
         self._file = file
-        self.set_data(bytearray(file.data))
+        # The hex view never modifies the data, so the file's bytes are shown without a copy
+        self.set_data(file.data)
 
     def get_file(self) -> IFile | None:
         return self._file
 
     def unload_file(self):
         self._file = None
-        self.set_data(bytearray())
+        self.set_data(b"")